@@ -3,14 +3,24 @@
 Persists AI configs in `ai.config`.
 """
 
-import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from src.ai.models import AIConfig
 from src.env import AI_CONFIG_FILE
-from src.utils.file_operator import FileOperator
+from src.utils.json_list_store import JsonListStore
+from src.utils.secrecy import secrecy_value
+
+_store = JsonListStore(AI_CONFIG_FILE, first_id=0)
+
+# (已解析的配置列表, 脱敏后的配置列表)，解析缓存更新后重建
+_masked_ais: Tuple[Optional[List[Dict[str, Any]]], List[Dict[str, Any]]] = (None, [])
+
+# (已解析的配置列表, 原始字典 id() -> 校验通过的 AI 配置)，解析缓存更新后重建
+_validated_ais: Tuple[Optional[List[Dict[str, Any]]], Dict[int, AIConfig]] = (None, {})
+
+_ai_list_adapter = TypeAdapter(List[AIConfig])
 
 
 class AICreateModel(BaseModel):
@@ -37,31 +47,48 @@ class AIUpdateModel(BaseModel):
     body: Optional[Dict[str, Any]] = None
 
 
-async def get_ai_config(ai_id: str) -> Optional[AIConfig]:
-    """从 ai.config 文件获取指定 AI 配置。"""
+def _masked_api_key(api_key: str) -> str:
+    return secrecy_value(api_key) if api_key else api_key
 
-    file_op = FileOperator(AI_CONFIG_FILE)
 
-    data_str = await file_op.read()
-    if not data_str:
-        return None
+def mask_ai_config(ai: AIConfig) -> Dict[str, Any]:
+    """返回 api_key 已脱敏的 AI 配置字典。"""
+    ai_dict = ai.model_dump(exclude={"api_key"})
+    ai_dict["api_key"] = _masked_api_key(ai.api_key)
+    return ai_dict
 
-    try:
-        ai_dicts = json.loads(data_str)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"{AI_CONFIG_FILE} JSON格式错误: {e}")
 
-    if not isinstance(ai_dicts, list):
-        return None
+async def _get_validated_ais() -> Dict[int, AIConfig]:
+    """校验文件中的全部 AI 配置，文件未变化时复用上次结果"""
+    global _validated_ais
+    ai_dicts = await _store.get_all()
+    if _validated_ais[0] is not ai_dicts:
+        ais: Dict[int, AIConfig] = {}
+        for ai_dict in ai_dicts:
+            if not isinstance(ai_dict, dict):
+                continue
+
+            try:
+                ais[id(ai_dict)] = AIConfig(**ai_dict)
+            except Exception:
+                # Skip invalid config
+                continue
+        _validated_ais = (ai_dicts, ais)
+    return _validated_ais[1]
 
-    ai_dict = next(
-        (item for item in ai_dicts if isinstance(item, dict) and item.get("id") == ai_id),
-        None,
-    )
+
+async def get_ai_config(ai_id: str) -> Optional[AIConfig]:
+    """从 ai.config 文件获取指定 AI 配置（共享实例，不可修改）。"""
+
+    ai_dict = await _store.get(ai_id)
 
     if not ai_dict:
         return None
 
+    ai = (await _get_validated_ais()).get(id(ai_dict))
+    if ai is not None:
+        return ai
+
     try:
         return AIConfig(**ai_dict)
     except Exception as e:
@@ -69,81 +96,44 @@ async def get_ai_config(ai_id: str) -> Optional[AIConfig]:
 
 
 async def get_all_ai_config() -> List[AIConfig]:
-    """从 ai.config 文件获取所有 AI 配置。"""
+    """从 ai.config 文件获取所有 AI 配置（共享实例，不可修改）。"""
+    return list((await _get_validated_ais()).values())
 
-    file_op = FileOperator(AI_CONFIG_FILE)
 
-    data_str = await file_op.read()
-    if not data_str:
-        return []
+async def get_all_ai_config_masked() -> List[Dict[str, Any]]:
+    """获取所有脱敏后的 AI 配置（带缓存）。"""
+    global _masked_ais
+    source = await _store.get_all()
+    if _masked_ais[0] is not source:
+        ais = await get_all_ai_config()
+        ai_dicts = _ai_list_adapter.dump_python(ais, exclude={"__all__": {"api_key"}})
+        for ai, ai_dict in zip(ais, ai_dicts):
+            ai_dict["api_key"] = _masked_api_key(ai.api_key)
+        _masked_ais = (source, ai_dicts)
+    return _masked_ais[1]
 
-    try:
-        ai_dicts = json.loads(data_str)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"{AI_CONFIG_FILE} JSON格式错误: {e}")
 
-    if not isinstance(ai_dicts, list):
-        return []
-
-    ais: List[AIConfig] = []
-    for ai_dict in ai_dicts:
-        if not isinstance(ai_dict, dict):
-            continue
-
-        try:
-            ai = AIConfig(**ai_dict)
-            ais.append(ai)
-        except Exception:
-            # Skip invalid config
-            continue
-
-    return ais
+async def get_ai_config_masked(ai_id: str) -> Optional[Dict[str, Any]]:
+    """获取指定的脱敏 AI 配置（带缓存）。"""
+    ais = await get_all_ai_config_masked()
+    return next((item for item in ais if item.get("id") == ai_id), None)
 
 
 async def add_ai_config(ai_config: AICreateModel) -> AIConfig:
     """添加 AI 配置到 ai.config 文件。"""
 
-    file_op = FileOperator(AI_CONFIG_FILE)
-
-    data_str = await file_op.read()
-    data = json.loads(data_str) if data_str else []
-    if not isinstance(data, list):
-        data = []
-
-    data.sort(key=lambda item: item["id"])
-
-    ai_id = int(data[-1]["id"]) + 1 if data else 0
-
-    ai_dict = ai_config.model_dump(exclude={"id"})
-    ai_dict["id"] = str(ai_id)
-
-    data.append(ai_dict)
-
-    await file_op.write(json.dumps(data, ensure_ascii=False, indent=2))
-
+    ai_dict = await _store.add(ai_config.model_dump(exclude={"id"}))
     return AIConfig(**ai_dict)
 
 
 async def update_ai_config(ai_id: str, ai_update: AIUpdateModel, exclude: set[str] = None) -> AIConfig:
     """更新 ai.config 文件中的 AI 配置。"""
 
-    file_op = FileOperator(AI_CONFIG_FILE)
-
-    data_str = await file_op.read()
-    data = json.loads(data_str) if data_str else []
-    if not isinstance(data, list):
-        data = []
-
-    ai_index = next((i for i, item in enumerate(data) if item.get("id") == ai_id), -1)
-    if ai_index == -1:
-        raise ValueError(f"AI ID {ai_id} 不存在")
-
     exclude = ({"id"} | exclude) if exclude else {"id"}
 
-    ai_dict = data[ai_index]
-    ai_dict.update(ai_update.model_dump(exclude=exclude))
-
-    await file_op.write(json.dumps(data, ensure_ascii=False, indent=2))
+    ai_dict = await _store.update(ai_id, ai_update.model_dump(exclude=exclude))
+    if ai_dict is None:
+        raise ValueError(f"AI ID {ai_id} 不存在")
 
     return AIConfig(**ai_dict)
 
@@ -151,22 +141,12 @@ async def update_ai_config(ai_id: str, ai_update: AIUpdateModel, exclude: set[st
 async def remove_ai_config(ai_id: str) -> Optional[AIConfig]:
     """从 ai.config 文件删除 AI 配置。"""
 
-    file_op = FileOperator(AI_CONFIG_FILE)
-
-    data_str = await file_op.read()
-    data = json.loads(data_str) if data_str else []
-    if not isinstance(data, list):
-        data = []
-
-    ai_index = next((i for i, item in enumerate(data) if item.get("id") == ai_id), -1)
-    if ai_index == -1:
+    removed_ai = await _store.remove(ai_id)
+    if removed_ai is None:
         return None
 
-    removed_ai = data.pop(ai_index)
-
-    await file_op.write(json.dumps(data, ensure_ascii=False, indent=2))
-
     try:
         return AIConfig(**removed_ai)
     except Exception:
-        return None
+        # 已删除的配置无效时仍视为删除成功
+        return AIConfig.model_construct(**removed_ai)
@@ -7,9 +7,10 @@ credentials, request templates, etc.).
 
 import json
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Union
 
-from pydantic import BaseModel, Field, field_validator, validator
+from pydantic import BaseModel, Field, field_validator
 
 MessageContent = Union[str, List[Dict[str, Any]]]
 
@@ -30,7 +31,8 @@ class AIMessage(BaseModel):
                     raise ValueError("多模态内容块必须包含type字段")
         return v
 
-    @validator('role')
+    @field_validator('role')
+    @classmethod
     def validate_role(cls, v):
         """验证角色"""
         valid_roles = ['system', 'user', 'assistant', 'function']
@@ -72,7 +74,8 @@ class AIConfig(BaseModel):
         description="请求体配置，JSON对象"
     )
 
-    @validator('endpoint')
+    @field_validator('endpoint')
+    @classmethod
     def validate_endpoint(cls, v):
         """验证端点URL"""
         if not v.startswith(('http://', 'https://')):
@@ -220,6 +223,7 @@ class AIPresetTemplate(BaseModel):
     body: Dict[str, Any] = Field(..., description="body模板示例")
 
     @classmethod
+    @lru_cache(maxsize=1)
     def get_preset_templates(cls) -> List["AIPresetTemplate"]:
         """获取预设模板列表"""
         return [
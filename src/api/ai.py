@@ -3,66 +3,108 @@ AI routes.
 
 Manage AI configurations (CRUD), connectivity tests, and chat.
 """
-from typing import List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Tuple
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Depends
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Response
 from pydantic import BaseModel
 
 from src.ai.models import AIConfig, AIMessage, AIPresetTemplate
 from src.ai.client import AIClient
 from src.ai.config import (
-    get_ai_config, get_all_ai_config,
+    get_ai_config, get_all_ai_config_masked,
+    get_ai_config_masked, mask_ai_config,
     add_ai_config, update_ai_config,
     remove_ai_config, AICreateModel, AIUpdateModel
 )
 from src.api.auth import verify_token
-from src.api.utils import success_response
-from src.utils.secrecy import secrecy_value, is_secrecy_value
+from src.api.utils import success_response, ORJSONResponse, CachedResponse
+from src.utils.secrecy import is_secrecy_value
+
+router = APIRouter(prefix="/ai", tags=["ai"], default_response_class=ORJSONResponse)
+
+# 预设模板为静态数据，启动时序列化一次
+_TEMPLATES_JSON = orjson.dumps(success_response(
+    '获取成功', [template.model_dump() for template in AIPresetTemplate.get_preset_templates()]
+))
+_ais_response = CachedResponse("获取成功")
+
+# 已保存 AI 的客户端缓存，复用连接池: id -> (配置指纹, 客户端)
+_clients: Dict[str, Tuple[str, AIClient]] = {}
+# 正在使用的请求数: id(客户端) -> 计数
+_client_users: Dict[int, int] = {}
+# 被替换或删除的客户端，最后一个使用中的请求结束后关闭
+_retired_clients: List[AIClient] = []
+
+
+def _get_client(config: AIConfig) -> AIClient:
+    """获取可复用的 AI 客户端，配置变化时重建"""
+    fingerprint = config.model_dump_json()
+    cached = _clients.get(config.id)
+    if cached:
+        if cached[0] == fingerprint:
+            return cached[1]
+        _retired_clients.append(cached[1])
+
+    client = AIClient(config)
+    _clients[config.id] = (fingerprint, client)
+    return client
+
+
+def _drop_client(ai_id: str):
+    cached = _clients.pop(ai_id, None)
+    if cached:
+        _retired_clients.append(cached[1])
+
+
+async def _close_idle_retired_clients():
+    """关闭已无请求使用的旧客户端"""
+    idle = [client for client in _retired_clients if id(client) not in _client_users]
+    for client in idle:
+        _retired_clients.remove(client)
+        await client.close()
+
+
+@asynccontextmanager
+async def _use_client(config: AIConfig) -> AsyncIterator[AIClient]:
+    """在请求期间持有客户端，避免被替换后提前关闭"""
+    client = _get_client(config)
+    key = id(client)
+    _client_users[key] = _client_users.get(key, 0) + 1
+    try:
+        yield client
+    finally:
+        if _client_users[key] > 1:
+            _client_users[key] -= 1
+        else:
+            del _client_users[key]
+        await _close_idle_retired_clients()
+
 
-router = APIRouter(prefix="/ai", tags=["ai"])
+async def close_ai_clients():
+    """关闭所有缓存的 AI 客户端"""
+    clients = [client for _, client in _clients.values()] + _retired_clients
+    _clients.clear()
+    _retired_clients.clear()
+    for client in clients:
+        await client.close()
 
 
 # --------------- AI templates ----------------
-@router.get("/templates", dependencies=[Depends(verify_token)])
+@router.get("/templates", dependencies=[Depends(verify_token)], response_model=None)
 async def api_get_ai_templates():
     """获取 AI 预设模板列表"""
-    try:
-        templates = AIPresetTemplate.get_preset_templates()
-        template_list = [
-            {
-                "id": template.id,
-                "name": template.name,
-                "description": template.description,
-                "api_key_domin": template.api_key_domin,
-                "endpoint": template.endpoint,
-                "api_key": template.api_key,
-                "model": template.model,
-                "headers": template.headers,
-                "body": template.body
-            }
-            for template in templates
-        ]
-        return success_response('获取成功', template_list)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"获取模板失败: {str(e)}")
+    return Response(content=_TEMPLATES_JSON, media_type="application/json")
 
 
 # --------------- AI config CRUD ----------------
-@router.get("", dependencies=[Depends(verify_token)])
+@router.get("", dependencies=[Depends(verify_token)], response_model=None)
 async def api_get_ais():
     """获取所有 AI 配置"""
     try:
-        configs = await get_all_ai_config()
-        ai_list = []
-        for config in configs:
-            if config:
-                provider_dict = config.model_dump()
-                if 'api_key' in provider_dict and provider_dict['api_key']:
-                    provider_dict['api_key'] = secrecy_value(provider_dict['api_key'])
-                ai_list.append(provider_dict)
-
-        return success_response("获取成功", ai_list)
+        return _ais_response.render(await get_all_ai_config_masked())
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"获取AI配置失败: {str(e)}")
 
@@ -75,11 +117,7 @@ async def api_create_ai(config: AICreateModel):
         if not config:
             raise HTTPException(status_code=500, detail="保存AI配置失败")
 
-        config = config.model_dump()
-        if 'api_key' in config and config['api_key']:
-            config['api_key'] = secrecy_value(config['api_key'])
-
-        return success_response("创建成功", config)
+        return success_response("创建成功", mask_ai_config(config))
     except HTTPException:
         raise
     except Exception as e:
@@ -89,21 +127,20 @@ async def api_create_ai(config: AICreateModel):
 @router.post("/test", dependencies=[Depends(verify_token)])
 async def api_ai_test(config: AICreateModel):
     try:
-        client = AIClient(AIConfig(**config.model_dump(), id='test'))
-
-        if config.multimodal:
-            response = await client.ask(
-                messages=[{
-                    "role": 'user',
-                    'content': [
-                        {'type': 'text', 'text': '描述图片'},
-                        {'type': 'image_url', 'image_url': 'https://inews.gtimg.com/om_bt/OsbU7Hilx3AaiHWB45v3QuxwkOeKDNrAaU1AxGLcH2xcIAA/641'},
-                    ]
-                }],
-                max_retries=2
-            )
-        else:
-            response = await client.ask(messages=[{"role": "user", "content": "Hello."}], max_retries=2)
+        async with AIClient(AIConfig(**config.model_dump(), id='test')) as client:
+            if config.multimodal:
+                response = await client.ask(
+                    messages=[{
+                        "role": 'user',
+                        'content': [
+                            {'type': 'text', 'text': '描述图片'},
+                            {'type': 'image_url', 'image_url': 'https://inews.gtimg.com/om_bt/OsbU7Hilx3AaiHWB45v3QuxwkOeKDNrAaU1AxGLcH2xcIAA/641'},
+                        ]
+                    }],
+                    max_retries=2
+                )
+            else:
+                response = await client.ask(messages=[{"role": "user", "content": "Hello."}], max_retries=2)
 
         if not response.success:
             raise HTTPException(status_code=500, detail=response.error)
@@ -122,14 +159,10 @@ async def api_ai_test(config: AICreateModel):
 async def api_get_ai(id: str):
     """获取单个 AI 配置"""
     try:
-        config = await get_ai_config(id)
+        config = await get_ai_config_masked(id)
         if not config:
             raise HTTPException(status_code=404, detail=f"AI '{id}' 未找到")
 
-        config = config.model_dump()
-        if 'api_key' in config and config['api_key']:
-            config['api_key'] = secrecy_value(config['api_key'])
-
         return success_response("获取成功", config)
     except HTTPException:
         raise
@@ -149,11 +182,7 @@ async def api_update_provider(id: str, config: AIUpdateModel):
         if not config:
             raise HTTPException(status_code=500, detail="更新AI配置失败")
 
-        config = config.model_dump()
-        if 'api_key' in config and config['api_key']:
-            config['api_key'] = secrecy_value(config['api_key'])
-
-        return success_response("更新成功", config)
+        return success_response("更新成功", mask_ai_config(config))
     except HTTPException:
         raise
     except Exception as e:
@@ -164,14 +193,12 @@ async def api_update_provider(id: str, config: AIUpdateModel):
 async def api_delete_provider(id: str):
     """删除 AI 配置"""
     try:
-        config = await get_ai_config(id)
-        if not config:
+        removed = await remove_ai_config(id)
+        if removed is None:
             raise HTTPException(status_code=404, detail=f"AI '{id}' 未找到")
 
-        config = await remove_ai_config(id)
-        if not config:
-            raise HTTPException(status_code=500, detail="删除AI配置失败")
-
+        _drop_client(id)
+        await _close_idle_retired_clients()
         return success_response("删除成功")
     except HTTPException:
         raise
@@ -188,21 +215,20 @@ async def api_test_provider(id: str):
         if not config:
             raise HTTPException(status_code=404, detail=f"AI '{id}' 未找到")
 
-        client = AIClient(config)
-
-        if config.multimodal:
-            response = await client.ask(
-                messages=[{
-                    "role": 'user',
-                    'content': [
-                        {'type': 'text', 'text': '描述图片'},
-                        {'type': 'image_url', 'image_url': 'https://inews.gtimg.com/om_bt/OsbU7Hilx3AaiHWB45v3QuxwkOeKDNrAaU1AxGLcH2xcIAA/641'},
-                    ]
-                }],
-                max_retries=2
-            )
-        else:
-            response = await client.ask(messages=[{"role": "user", "content": "Hello."}], max_retries=2)
+        async with _use_client(config) as client:
+            if config.multimodal:
+                response = await client.ask(
+                    messages=[{
+                        "role": 'user',
+                        'content': [
+                            {'type': 'text', 'text': '描述图片'},
+                            {'type': 'image_url', 'image_url': 'https://inews.gtimg.com/om_bt/OsbU7Hilx3AaiHWB45v3QuxwkOeKDNrAaU1AxGLcH2xcIAA/641'},
+                        ]
+                    }],
+                    max_retries=2
+                )
+            else:
+                response = await client.ask(messages=[{"role": "user", "content": "Hello."}], max_retries=2)
 
         if not response.success:
             raise HTTPException(status_code=500, detail=response.error)
@@ -231,11 +257,11 @@ async def api_chat_with_provider(id: str, request: ChatRequest):
         if not config:
             raise HTTPException(status_code=404, detail=f"AI '{id}' 未找到")
 
-        client = AIClient(config)
-        response = await client.ask(
-            messages=request.messages,
-            parameters=request.parameters
-        )
+        async with _use_client(config) as client:
+            response = await client.ask(
+                messages=request.messages,
+                parameters=request.parameters
+            )
 
         if not response.success:
             raise HTTPException(status_code=500, detail=response.error)
@@ -5,11 +5,14 @@
 import hashlib
 import os
 import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from jose import JWTError, jwt
+import jwt
+from jwt import PyJWTError
 
 from src.api.utils import success_response
 from src.env import WEB_USERNAME, WEB_PASSWORD, SECRET_KEY_FILE
@@ -35,6 +38,12 @@ def load_or_create_secret_key():
 SECRET_KEY = load_or_create_secret_key()
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24
+WEB_PASSWORD_MD5 = hashlib.md5(WEB_PASSWORD.encode('utf-8')).hexdigest()
+TOKEN_CACHE_SIZE = 1024
+TOKEN_CACHE_TTL = 300
+
+# 已验证令牌缓存: token -> 缓存过期时间戳
+_verified_tokens: OrderedDict[str, float] = OrderedDict()
 
 # OAuth2 方案
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/legacy_login")
@@ -50,14 +59,25 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
 
 
 async def verify_token(token: str = Depends(oauth2_scheme)):
-    """验证JWT令牌"""
+    """验证JWT令牌，近期验证通过的令牌直接放行"""
+    now = time.time()
+    expire_at = _verified_tokens.get(token)
+    if expire_at is not None:
+        if expire_at > now:
+            _verified_tokens.move_to_end(token)
+            return
+        del _verified_tokens[token]
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username = payload.get("sub")
-        if username != WEB_USERNAME:
-            raise HTTPException(status_code=401, detail="无效的 Token")
-    except JWTError:
+    except PyJWTError:
         raise HTTPException(status_code=401, detail="认证失败")
+    if payload.get("sub") != WEB_USERNAME:
+        raise HTTPException(status_code=401, detail="无效的 Token")
+
+    _verified_tokens[token] = min(payload.get("exp", now), now + TOKEN_CACHE_TTL)
+    if len(_verified_tokens) > TOKEN_CACHE_SIZE:
+        _verified_tokens.popitem(last=False)
 
 
 def get_access_token(data: OAuth2PasswordRequestForm):
@@ -68,11 +88,8 @@ def get_access_token(data: OAuth2PasswordRequestForm):
     # web_username = config_data.get("server", {}).get("web_username", WEB_USERNAME)
     # web_password = config_data.get("server", {}).get("web_password", WEB_PASSWORD)
     web_username = WEB_USERNAME
-    web_password = WEB_PASSWORD
-
-    web_password_md5 = hashlib.md5(web_password.encode('utf-8')).hexdigest()
 
-    if data.username != web_username or data.password != web_password_md5:
+    if data.username != web_username or data.password != WEB_PASSWORD_MD5:
         raise HTTPException(status_code=401, detail="用户名或密码错误")
 
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
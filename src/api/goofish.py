@@ -2,14 +2,14 @@
 Goofish状态相关路由模块
 处理Goofish状态的保存、删除、查询等操作
 """
-import json
-import os
-from fastapi import APIRouter, HTTPException, Depends
+import aiofiles.os
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Header
 
 from src.account.login import start_login, check_login, login, send_sms_code, close_login_session
 from src.account.verify import verify_login
 from src.api.auth import verify_token
-from src.api.utils import success_response
+from src.api.utils import success_response, ORJSONResponse
 from src.types import (
     GoofishState,
     GoofishStartLoginRequest,
@@ -18,23 +18,32 @@ from src.types import (
     GoofishLoginRequest,
 )
 from src.env import STATE_FILE
+from src.utils.file_operator import FileOperator
 
 # 创建路由器
-router = APIRouter(prefix="/goofish", tags=["goofish"])
+router = APIRouter(prefix="/goofish", tags=["goofish"], default_response_class=ORJSONResponse)
 
 
 # --------------- Goofish状态相关接口 ----------------
 @router.post("/state/save", dependencies=[Depends(verify_token)])
-async def api_save_goofish_state(data: GoofishState):
-    """保存Goofish状态"""
+async def api_save_goofish_state(data: GoofishState, x_skip_validate: bool = Header(False)):
+    """
+    保存Goofish状态
+    X-Skip-Validate 为 true/1 时跳过 JSON 校验
+    """
     try:
-        # 验证JSON格式
-        json.loads(data.content)
-        with open(STATE_FILE, 'w', encoding='utf-8') as f:
-            f.write(data.content)
+        if x_skip_validate:
+            if not data.content.strip():
+                raise HTTPException(status_code=400, detail="内容不能为空")
+        else:
+            # 验证JSON格式
+            orjson.loads(data.content)
+        await FileOperator(STATE_FILE).write(data.content)
         return success_response("保存成功")
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=400, detail="提供的内容不是有效的JSON格式")
+    except HTTPException:
+        raise
     except Exception:
         raise HTTPException(status_code=500, detail="保存失败")
 
@@ -43,11 +52,13 @@ async def api_save_goofish_state(data: GoofishState):
 async def api_delete_goofish_state():
     """删除Goofish状态"""
     try:
-        if os.path.exists(STATE_FILE):
-            os.remove(STATE_FILE)
+        if await aiofiles.os.path.exists(STATE_FILE):
+            await aiofiles.os.remove(STATE_FILE)
             return success_response("删除成功")
         else:
             raise HTTPException(status_code=404, detail="文件未找到")
+    except HTTPException:
+        raise
     except Exception:
         raise HTTPException(status_code=500, detail="删除失败")
 
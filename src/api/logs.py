@@ -1,30 +1,52 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from starlette.responses import StreamingResponse
 
 from src.api.auth import verify_token
-from src.api.utils import success_response
-from src.task.logs import get_task_logs
+from src.api.utils import ORJSONResponse
+from src.task.logs import iter_task_logs
+from src.types import TaskLogEntry
+from src.utils.date import from_timestamp
 from src.utils.logger import logger
 
-router = APIRouter(prefix='/logs', tags=['logs'])
+router = APIRouter(prefix='/logs', tags=['logs'], default_response_class=ORJSONResponse)
 
 
 class LogsRequest(BaseModel):
     from_time: Optional[str] = None
+    # 毫秒时间戳，优先于 from_time，省去 ISO 字符串解析
+    from_time_ms: Optional[int] = None
     limit: Optional[int] = None
     levels: Optional[List[str]] = None
 
 
+async def _stream_logs_response(message: str, logs: AsyncIterator[TaskLogEntry]):
+    """按 success_response 的格式逐条输出日志，避免一次性拼接整个列表"""
+    yield b'{"message":' + orjson.dumps(message) + b',"data":['
+    separator = b''
+    async for log in logs:
+        yield separator + orjson.dumps(log)
+        separator = b','
+    yield b']}'
+
+
 @router.post("/{task_id}", dependencies=[Depends(verify_token)])
 async def api_get_task_logs(task_id: int, data: LogsRequest):
     """获取任务日志"""
     try:
-        from_time = datetime.fromisoformat(data.from_time) if data.from_time else None
-        logs = await get_task_logs(task_id, from_time, data.limit, data.levels)
-        return success_response("任务日志获取成功", logs)
+        if data.from_time_ms is not None:
+            from_time = from_timestamp(data.from_time_ms / 1000).replace(tzinfo=None)
+        else:
+            from_time = datetime.fromisoformat(data.from_time) if data.from_time else None
+        logs = iter_task_logs(task_id, from_time, data.limit, data.levels)
+        return StreamingResponse(
+            _stream_logs_response("任务日志获取成功", logs),
+            media_type="application/json"
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -4,21 +4,27 @@ Notifier相关路由模块
 """
 from typing import Tuple
 
-from fastapi import APIRouter, HTTPException, Depends
-
-from src.api.auth import verify_token, success_response
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Response
 
+from src.api.auth import verify_token
+from src.api.utils import success_response, ORJSONResponse, CachedResponse
 from src.notify.config import (
-    get_notifier_config, get_all_notifiers,
+    get_notifier_config, get_all_notifiers_masked,
+    get_notifier_config_masked, mask_notifier_config,
     add_notifier_config, update_notifier_config,
     remove_notifier_config
 )
 from src.notify.notify_manager import NotificationManager
-from src.notify.template import get_notifier_templates
-from src.utils.secrecy import secrecy_value, is_secrecy_value
+from src.notify.template import get_notifier_templates, get_notifier_secrecy_keys
+from src.utils.secrecy import is_secrecy_value
 
 # 创建路由器
-router = APIRouter(prefix="/notifier", tags=["notifier"])
+router = APIRouter(prefix="/notifier", tags=["notifier"], default_response_class=ORJSONResponse)
+
+# 预设模板为静态数据，启动时序列化一次
+_TEMPLATES_JSON = orjson.dumps(success_response('获取成功', get_notifier_templates()))
+_notifiers_response = CachedResponse("获取成功")
 
 
 def _verify_config(config: dict) -> Tuple[bool, str | None]:
@@ -36,43 +42,20 @@ def _verify_config(config: dict) -> Tuple[bool, str | None]:
     return True, None
 
 
-def _mask_config(config: dict, secrecy_keys: list[str]) -> dict:
-    for key in secrecy_keys:
-        config[key] = secrecy_value(config[key])
-    return config
-
-
-def _get_notifier_secrecy_keys(type: str) -> list:
-    templates = get_notifier_templates()
-    template = next((it for it in templates if it['type'] == type), {})
-    return [key for key, value in template.get('template', {}).items() if value.get('type', '') == 'password']
-
-
 # --------------- Notifier模板接口 ----------------
 
-@router.get("/templates", dependencies=[Depends(verify_token)])
+@router.get("/templates", dependencies=[Depends(verify_token)], response_model=None)
 async def api_get_notifier_templates():
     """获取Notifier预设模板列表"""
-    try:
-        templates = get_notifier_templates()
-        return success_response('获取成功', templates)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"获取模板失败: {str(e)}")
+    return Response(content=_TEMPLATES_JSON, media_type="application/json")
 
 
 # --------------- Notifier配置管理接口 ----------------
-@router.get("", dependencies=[Depends(verify_token)])
+@router.get("", dependencies=[Depends(verify_token)], response_model=None)
 async def api_get_notifiers():
     """获取所有Notifier配置"""
     try:
-        notifiers = await get_all_notifiers()
-        templates = get_notifier_templates()
-        for notifier in notifiers:
-            template = next(it for it in templates if it['type'] == notifier['type'])
-            secrecy_keys = [key for key, value in template['template'].items() if value['type'] == 'password']
-            _mask_config(notifier, secrecy_keys)
-
-        return success_response("获取成功", notifiers)
+        return _notifiers_response.render(await get_all_notifiers_masked())
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"获取Notifier配置失败: {str(e)}")
 
@@ -87,10 +70,7 @@ async def api_create_notifier(config: dict):
         notifier = await add_notifier_config(config)
         if not notifier:
             raise HTTPException(status_code=500, detail="保存Notifier配置失败")
-        secrecy_keys = _get_notifier_secrecy_keys(notifier.get('type'))
-        notifier = _mask_config(notifier, secrecy_keys)
-
-        return success_response("创建成功", notifier)
+        return success_response("创建成功", mask_notifier_config(notifier))
 
     except HTTPException:
         raise
@@ -102,13 +82,10 @@ async def api_create_notifier(config: dict):
 async def api_get_notifier(notifier_id: str):
     """获取单个Notifier配置"""
     try:
-        notifier = await get_notifier_config(notifier_id)
+        notifier = await get_notifier_config_masked(notifier_id)
         if not notifier:
             raise HTTPException(status_code=404, detail=f"Notifier '{notifier_id}' 未找到")
 
-        secrecy_keys = _get_notifier_secrecy_keys(notifier.get('type'))
-        notifier = _mask_config(notifier, secrecy_keys)
-
         return success_response("获取成功", notifier)
 
     except HTTPException:
@@ -125,7 +102,7 @@ async def api_notifier_test(config: dict):
         if not notifier:
             raise HTTPException(status_code=500, detail=f"测试失败，无效配置")
 
-        notifier.test()
+        await notifier.test()
         return success_response('测试成功')
     except HTTPException:
         raise
@@ -137,7 +114,7 @@ async def api_notifier_test(config: dict):
 async def api_update_notifier(notifier_id: str, config: dict):
     """更新Notifier配置"""
     try:
-        secrecy_keys = _get_notifier_secrecy_keys(config.get('type'))
+        secrecy_keys = get_notifier_secrecy_keys(config.get('type'))
 
         for key in secrecy_keys:
             value = config.get(key, None)
@@ -148,9 +125,7 @@ async def api_update_notifier(notifier_id: str, config: dict):
         if not notifier:
             raise HTTPException(status_code=500, detail="更新Notifier配置失败")
 
-        notifier = _mask_config(notifier, secrecy_keys)
-
-        return success_response("更新成功", notifier)
+        return success_response("更新成功", mask_notifier_config(notifier))
 
     except HTTPException:
         raise
@@ -162,14 +137,10 @@ async def api_update_notifier(notifier_id: str, config: dict):
 async def api_delete_notifier(notifier_id: str):
     """删除Notifier配置"""
     try:
-        existing_notifier = await get_notifier_config(notifier_id)
-        if not existing_notifier:
+        removed = await remove_notifier_config(notifier_id)
+        if removed is None:
             raise HTTPException(status_code=404, detail=f"Notifier '{notifier_id}' 未找到")
 
-        result = await remove_notifier_config(notifier_id)
-        if not result:
-            raise HTTPException(status_code=500, detail="删除Notifier配置失败")
-
         return success_response("删除成功")
     except HTTPException:
         raise
@@ -190,7 +161,7 @@ async def api_test_notifier(notifier_id: str):
         if not notifier:
             raise HTTPException(status_code=500, detail="创建Notifier实例失败")
 
-        notifier.test()
+        await notifier.test()
 
         return success_response('测试成功')
     except HTTPException:
@@ -2,18 +2,20 @@
 结果相关路由模块
 处理任务结果的查询、删除等操作
 """
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Depends
 
 from src.api.auth import verify_token
-from src.api.utils import success_response
+from src.api.utils import success_response, ORJSONResponse
 from src.task.result import get_task_result, remove_task_result, get_product_history_info
 from src.types import PaginationOptions
 
 # 创建路由器
-router = APIRouter(prefix="/results", tags=["results"])
+router = APIRouter(prefix="/results", tags=["results"], default_response_class=ORJSONResponse)
 
 # --------------- 结果相关接口 ----------------
-@router.post("/{task_id}", dependencies=[Depends(verify_token)])
+@router.post("/{task_id}", response_model=None, dependencies=[Depends(verify_token)])
 async def api_get_task_results(task_id: int, data: PaginationOptions):
     """获取任务结果"""
     try:
@@ -29,7 +31,7 @@ async def api_get_task_results(task_id: int, data: PaginationOptions):
             sort_by=data.sort_by,
             order=data.order
         )
-        return success_response("结果获取成功", result)
+        return ORJSONResponse(success_response("结果获取成功", result))
     except Exception:
         raise HTTPException(status_code=500, detail="结果获取失败")
 
@@ -38,7 +40,7 @@ async def api_get_task_results(task_id: int, data: PaginationOptions):
 async def api_remove_task_results(task_id: int):
     """删除任务结果"""
     try:
-        remove_task_result(task_id)
+        await asyncio.to_thread(remove_task_result, task_id)
         return success_response("删除成功")
     except Exception:
         raise HTTPException(status_code=500, detail="删除失败")
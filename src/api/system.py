@@ -2,22 +2,29 @@
 系统相关路由模块
 处理系统配置、AI测试等功能
 """
+import asyncio
 
+import orjson
 from fastapi import APIRouter, HTTPException, Depends
+from starlette.responses import Response
 
 from src.api.auth import verify_token
-from src.api.utils import success_response
+from src.api.utils import success_response, ORJSONResponse
 from src.config import set_global_config, AppConfig, get_config_instance
 from src.types import AppConfigModel
 
 # 创建路由器
-router = APIRouter(prefix="/system", tags=["system"])
+router = APIRouter(prefix="/system", tags=["system"], default_response_class=ORJSONResponse)
+
+# 与 success_response('获取成功', ...) 一致的响应体前缀
+_GET_SYSTEM_PREFIX = b'{"message":' + orjson.dumps('获取成功') + b',"data":'
 
 # --------------- 系统相关接口 ----------------
-@router.get("", dependencies=[Depends(verify_token)])
+@router.get("", response_model=None, dependencies=[Depends(verify_token)])
 async def api_get_system():
     """获取系统配置"""
-    return success_response('获取成功', get_config_instance().get_config())
+    config_json = get_config_instance().get_config_json()
+    return Response(content=_GET_SYSTEM_PREFIX + config_json + b'}', media_type="application/json")
 
 
 @router.post("", dependencies=[Depends(verify_token)])
@@ -35,7 +42,7 @@ async def api_save_system(config: AppConfigModel):
                 detail=f"配置验证失败: {'; '.join(error_messages)}"
             )
 
-        success = set_global_config(config)
+        success = await asyncio.to_thread(set_global_config, config, True)
         if not success:
             raise HTTPException(status_code=500, detail="配置保存失败")
 
@@ -3,25 +3,33 @@
 处理任务的增删改查、启停等操作
 """
 import asyncio
+from functools import lru_cache
 from typing import Optional
 
 from apscheduler.triggers.cron import CronTrigger
 from fastapi import APIRouter, HTTPException, Depends
 
 from src.api.auth import verify_token
-from src.api.utils import success_response
+from src.api.utils import success_response, ORJSONResponse
 from src.server.scheduler import (
     add_task_to_scheduler,
     update_scheduled_task, run_task, remove_task_from_scheduler,
     is_task_running, get_all_running_tasks, stop_task, get_task_status
 )
-from src.task.record import get_task_record
+from src.task.record import get_task_record, get_task_records
 from src.task.task import get_tasks, add_task, update_task, get_task, remove_task
 from src.types import Task
 from src.utils.logger import logger
 
 # 创建路由器
-router = APIRouter(prefix="/tasks", tags=["tasks"])
+router = APIRouter(prefix="/tasks", tags=["tasks"], default_response_class=ORJSONResponse)
+
+
+@lru_cache(maxsize=512)
+def _validate_cron(cron_str: str) -> bool:
+    """解析 cron 表达式，无效时抛出异常（异常不会被缓存）"""
+    CronTrigger.from_crontab(cron_str, timezone='Asia/Shanghai')
+    return True
 
 
 def _as_bool(value, field_name: str) -> bool:
@@ -43,22 +51,36 @@ def _as_positive_int(value, field_name: str) -> int:
     raise HTTPException(status_code=400, detail=f"{field_name} 必须为整数")
 
 
+_MISSING = object()
+
+
+def _field(payload: Task, old_task: Optional[Task], name: str, default=None):
+    """优先取本次提交的字段，未提交时回退到原任务"""
+    if name in payload:
+        return payload[name]
+    if old_task and name in old_task:
+        return old_task[name]
+    return default
+
+
 def _validate_task_payload(payload: Task, *, creating: bool, old_task: Optional[Task] = None) -> Task:
     if not isinstance(payload, dict):
         raise HTTPException(status_code=400, detail="请求体必须为 JSON 对象")
 
-    merged = payload if creating else {**(old_task or {}), **payload}
+    if creating:
+        old_task = None
 
-    task_name = merged.get('task_name')
+    task_name = _field(payload, old_task, 'task_name')
     if not isinstance(task_name, str) or not task_name.strip():
         raise HTTPException(status_code=400, detail="任务名称不能为空")
 
-    keyword = merged.get('keyword')
+    keyword = _field(payload, old_task, 'keyword')
     if not isinstance(keyword, str) or not keyword.strip():
         raise HTTPException(status_code=400, detail="搜索关键字不能为空")
 
-    if 'max_pages' in merged:
-        max_pages = _as_positive_int(merged.get('max_pages'), 'max_pages')
+    max_pages = _field(payload, old_task, 'max_pages', _MISSING)
+    if max_pages is not _MISSING:
+        max_pages = _as_positive_int(max_pages, 'max_pages')
     else:
         if creating:
             raise HTTPException(status_code=400, detail="max_pages 不能为空")
@@ -67,16 +89,15 @@ def _validate_task_payload(payload: Task, *, creating: bool, old_task: Optional[
     if max_pages is not None:
         payload['max_pages'] = max_pages
 
-    enabled = merged.get('enabled', False)
-    enabled = _as_bool(enabled, 'enabled')
+    enabled = _as_bool(_field(payload, old_task, 'enabled', False), 'enabled')
     payload['enabled'] = enabled
 
     if enabled:
-        cron_str = merged.get('cron')
+        cron_str = _field(payload, old_task, 'cron')
         if not isinstance(cron_str, str) or not cron_str.strip():
             raise HTTPException(status_code=400, detail="启用任务时 cron 不能为空")
         try:
-            CronTrigger.from_crontab(cron_str.strip(), timezone='Asia/Shanghai')
+            _validate_cron(cron_str.strip())
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"cron 表达式无效: {e}")
         payload['cron'] = cron_str.strip()
@@ -106,21 +127,21 @@ async def api_get_task_status(task_id: int):
 
 
 # --------------- 任务相关接口 ----------------
-@router.get("", dependencies=[Depends(verify_token)])
+@router.get("", response_model=None, dependencies=[Depends(verify_token)])
 async def api_get_tasks():
     """获取所有任务"""
     try:
         tasks = await get_tasks()
+        records = await get_task_records()
         for task in tasks:
             task_id = task.get('task_id')
             if task_id is None:
                 continue
             task_state = get_task_status(task_id)
             task.update(task_state)
-            task_record = await get_task_record(task_id)
-            task['run_record'] = task_record
+            task['run_record'] = records.get(task_id)
 
-        return success_response("任务获取成功", tasks)
+        return ORJSONResponse(success_response("任务获取成功", tasks))
     except Exception as e:
         logger.error(f"读取任务配置失败: {e}")
         raise HTTPException(status_code=500, detail="读取任务配置时发生错误")
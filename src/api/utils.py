@@ -1,4 +1,33 @@
+import orjson
+from starlette.responses import JSONResponse, Response
+
+
 # ----------------- 统一返回工具 -----------------
 def success_response(message: str, data=None):
     """统一成功响应格式"""
-    return {"message": message, "data": data}
\ No newline at end of file
+    return {"message": message, "data": data}
+
+
+class ORJSONResponse(JSONResponse):
+    """使用 orjson 序列化的 JSON 响应"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class CachedResponse:
+    """
+    缓存序列化后的成功响应体
+    以数据对象本身为键，上游缓存失效重建后自动重新序列化，数据不可原地修改
+    """
+
+    def __init__(self, message: str):
+        self.message = message
+        self._data = None
+        self._body = b''
+
+    def render(self, data) -> Response:
+        if data is not self._data or not self._body:
+            self._body = orjson.dumps(success_response(self.message, data), option=orjson.OPT_NON_STR_KEYS)
+            self._data = data
+        return Response(content=self._body, media_type="application/json")
@@ -2,14 +2,53 @@
 配置管理
 """
 
-import json
+import copy
 import os
+import threading
 from typing import Dict, Any, List, Optional, ClassVar
 
+import orjson
+
 from src.env import APP_CONFIG_FILE
 from src.types import AppConfigModel, NotificationConfig, BrowserConfig, EvaluatorConfig
 from src.utils.logger import logger
 
+# 默认配置模板，使用时深拷贝
+_DEFAULT_CONFIG: AppConfigModel = {
+    "browser": {
+        "headless": True,
+        "channel": "chrome"
+    },
+    "notifications": {
+        "enabled": False,
+        "threshold": 60
+    },
+    "evaluator": {
+        "enabled": True,
+        "textAI": None,
+        "imageAI": None
+    }
+}
+
+_VALID_CHANNELS = frozenset(("chrome", "firefox", "webkit"))
+
+# (配置分区, 字段) -> (校验函数, 错误信息)
+_CONFIG_VALIDATORS = {
+    ("browser", "headless"): (lambda v: isinstance(v, bool), "headless 必须是布尔值"),
+    ("browser", "channel"): (lambda v: isinstance(v, str) and v in _VALID_CHANNELS,
+                             "channel 必须是 chrome, firefox, webkit 之一"),
+    ("notifications", "enabled"): (lambda v: isinstance(v, bool), "enabled 必须是布尔值"),
+    ("evaluator", "enabled"): (lambda v: isinstance(v, bool), "enabled 必须是布尔值"),
+}
+
+# 常用配置项的预拆分路径
+_NOTIFY_ENABLED = ("notification", "enabled")
+_EVAL_ENABLED = ("evaluator", "enabled")
+_EVAL_TEXT_AI = ("evaluator", "textAI")
+_EVAL_IMAGE_AI = ("evaluator", "imageAI")
+_BROWSER_HEADLESS = ("browser", "headless")
+_BROWSER_CHANNEL = ("browser", "channel")
+
 
 class AppConfig:
     """应用配置类"""
@@ -25,6 +64,11 @@ class AppConfig:
             cls._instance = super().__new__(cls)
             cls._instance.config_file = config_file
             cls._instance.config = cls._instance._get_default_config()
+            # 配置版本号，配置加载或保存时递增；序列化缓存为 (版本号, 序列化结果)
+            cls._instance._version = 0
+            cls._instance._config_json = (-1, b'')
+            # 串行化配置写入与版本号更新，多个线程同时保存时不会交错写入临时文件
+            cls._instance._save_lock = threading.Lock()
 
         return cls._instance
 
@@ -40,21 +84,7 @@ class AppConfig:
     @staticmethod
     def _get_default_config() -> AppConfigModel:
         """获取默认配置"""
-        return {
-            "browser": {
-                "headless": True,
-                "channel": "chrome"
-            },
-            "notifications": {
-                "enabled": False,
-                "threshold": 60
-            },
-            "evaluator": {
-                "enabled": True,
-                "textAI": None,
-                "imageAI": None
-            }
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG)
 
     def load_config(self) -> bool:
         """从文件加载配置"""
@@ -63,16 +93,18 @@ class AppConfig:
                 logger.warning(f"配置文件不存在: {self.config_file}，使用默认配置")
                 return True
 
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                loaded_config = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                loaded_config = orjson.loads(f.read())
 
-            merged_config = self._deep_merge(dict(self.config.copy()), loaded_config)
-            self.config = AppConfigModel(**merged_config)
+            merged_config = self._deep_merge(self.config, loaded_config)
+            with self._save_lock:
+                self.config = merged_config
+                self._version += 1
 
             logger.info(f"配置加载成功: {self.config_file}")
             return True
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"配置文件JSON解析失败: {e}")
             return False
         except Exception as e:
@@ -80,27 +112,39 @@ class AppConfig:
             return False
 
     def save_config(self) -> bool:
-        """保存配置到文件"""
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
-
-            logger.info(f"配置保存成功: {self.config_file}")
-            return True
+        """保存配置到文件，先写临时文件再替换，避免中断时损坏配置"""
+        with self._save_lock:
+            # 所有修改配置的路径都会调用保存，在此统一使序列化缓存失效
+            self._version += 1
+            temp_file = f"{self.config_file}.tmp"
+            try:
+                with open(temp_file, 'wb') as f:
+                    f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+                os.replace(temp_file, self.config_file)
+
+                logger.info(f"配置保存成功: {self.config_file}")
+                return True
 
-        except Exception as e:
-            logger.error(f"保存配置文件失败: {e}")
-            return False
+            except Exception as e:
+                logger.error(f"保存配置文件失败: {e}")
+                return False
 
-    def _deep_merge(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """深度合并两个字典"""
+    @staticmethod
+    def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+        """深度合并两个字典，只复制被覆盖路径上的子字典，不修改 base"""
         result = base.copy()
-
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+        stack = [(result, override)]
+
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    current = current.copy()
+                    target[key] = current
+                    stack.append((current, value))
+                else:
+                    target[key] = value
 
         return result
 
@@ -115,10 +159,13 @@ class AppConfig:
         Returns:
             配置值
         """
-        keys = key.split('.')
+        return self._get_path(key.split('.'), default)
+
+    def _get_path(self, path, default: Any = None) -> Any:
+        """按预拆分的键路径获取配置值"""
         value = self.config
 
-        for k in keys:
+        for k in path:
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
@@ -171,27 +218,27 @@ class AppConfig:
 
     @property
     def is_notifications_enabled(self) -> bool:
-        return self.get('notification.enabled', True)
+        return self._get_path(_NOTIFY_ENABLED, True)
 
     @property
     def is_evaluator_enabled(self) -> bool:
-        return self.get('evaluator.enabled', True)
+        return self._get_path(_EVAL_ENABLED, True)
 
     @property
     def evaluator_text_ai(self):
-        return self.get('evaluator.textAI', None)
+        return self._get_path(_EVAL_TEXT_AI, None)
 
     @property
     def evaluator_image_ai(self):
-        return self.get('evaluator.imageAI', None)
+        return self._get_path(_EVAL_IMAGE_AI, None)
 
     @property
     def browser_headless(self):
-        return self.get('browser.headless', True)
+        return self._get_path(_BROWSER_HEADLESS, True)
 
     @property
     def browser_channel(self):
-        return self.get('browser.channel', 'chrome')
+        return self._get_path(_BROWSER_CHANNEL, 'chrome')
 
     def update_config(self, updates: AppConfigModel) -> bool:
         """
@@ -210,8 +257,8 @@ class AppConfig:
             })
         """
         try:
-            merged_config = self._deep_merge(dict(self.config.copy()), dict(updates.copy()))
-            self.config = AppConfigModel(**merged_config)
+            merged_config = self._deep_merge(self.config, updates)
+            self.config = merged_config
             return self.save_config()
         except Exception as e:
             logger.error(f"批量更新配置失败: {updates}, 错误: {e}")
@@ -229,26 +276,13 @@ class AppConfig:
             验证错误字典，为空表示验证通过
         """
         errors = {}
+        if not config:
+            return errors
 
-        # 验证浏览器配置
-        if "browser" in config:
-            browser = config["browser"]
-            if "headless" in browser and not isinstance(browser["headless"], bool):
-                errors.setdefault("browser", []).append("headless 必须是布尔值")
-            if "channel" in browser and browser["channel"] not in ["chrome", "firefox", "webkit"]:
-                errors.setdefault("browser", []).append("channel 必须是 chrome, firefox, webkit 之一")
-
-        # 验证通知配置
-        if "notifications" in config:
-            notifications = config["notifications"]
-            if "enabled" in notifications and not isinstance(notifications["enabled"], bool):
-                errors.setdefault("notifications", []).append("enabled 必须是布尔值")
-
-        # 验证评估器配置
-        if "evaluator" in config:
-            evaluator = config["evaluator"]
-            if "enabled" in evaluator and not isinstance(evaluator["enabled"], bool):
-                errors.setdefault("evaluator", []).append("enabled 必须是布尔值")
+        for (section, field), (check, message) in _CONFIG_VALIDATORS.items():
+            values = config.get(section)
+            if isinstance(values, dict) and field in values and not check(values[field]):
+                errors.setdefault(section, []).append(message)
 
         return errors
 
@@ -261,12 +295,13 @@ class AppConfig:
         """
         return self.validate_config(self.config)
 
-    def set_config(self, config: AppConfigModel) -> bool:
+    def set_config(self, config: AppConfigModel, validated: bool = False) -> bool:
         """
         全量设置配置
 
         Args:
             config: 完整的配置字典
+            validated: 调用方是否已通过 validate_config 校验，为 True 时跳过重复校验
 
         Returns:
             是否成功
@@ -278,10 +313,11 @@ class AppConfig:
             })
         """
         try:
-            validation_errors = self.validate_config(config)
-            if validation_errors:
-                logger.error(f"配置验证失败: {validation_errors}")
-                return False
+            if not validated:
+                validation_errors = self.validate_config(config)
+                if validation_errors:
+                    logger.error(f"配置验证失败: {validation_errors}")
+                    return False
 
             # 设置新配置
             self.config = config
@@ -294,7 +330,21 @@ class AppConfig:
             return False
 
     def get_config(self) -> Dict[str, Any]:
-        return dict(self.config.copy())
+        return self.config.copy()
+
+    def get_config_json(self) -> bytes:
+        """获取序列化后的配置，配置保存或重新加载后重新生成"""
+        version = self._version
+        cached_version, body = self._config_json
+        if cached_version == version:
+            return body
+
+        body = orjson.dumps(self.config)
+        with self._save_lock:
+            # 序列化期间配置被其他线程修改时不写入缓存，避免缓存旧配置
+            if self._version == version:
+                self._config_json = (version, body)
+        return body
 
 
 def get_config_instance() -> AppConfig:
@@ -312,6 +362,6 @@ def update_global_config(updates: AppConfigModel) -> bool:
     return AppConfig().update_config(updates)
 
 
-def set_global_config(config: AppConfigModel) -> bool:
+def set_global_config(config: AppConfigModel, validated: bool = False) -> bool:
     """全量设置全局配置"""
-    return AppConfig().set_config(config)
+    return AppConfig().set_config(config, validated)
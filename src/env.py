@@ -30,7 +30,6 @@ try:
     MAX_CONCURRENT_TASKS = int(os.getenv("MAX_CONCURRENT_TASKS", "3"))
     SERVER_PORT = int(os.getenv("SERVER_PORT", "8000"))
     os.makedirs(LOGS_DIR, exist_ok=True)
-    os.makedirs(IMAGE_SAVE_DIR, exist_ok=True)
     os.makedirs(RESULT_DIR, exist_ok=True)
 except Exception as e:
     logger.error("配置加载过程中发生错误: {}", e)
@@ -7,15 +7,46 @@
 
 子类只需实现 `_do_send` 和 `test`。
 """
+import asyncio
 from abc import ABC, abstractmethod
+from typing import Optional
+
+import httpx
 
 from src.types import TaskResult
 from src.utils.logger import logger
 
+_EMPTY: dict = {}
+_ITEM_LINK_PREFIX = "https://h5.m.goofish.com/item?id="
+
+# 所有通知器共享的连接池，避免每次推送重新建立连接；连接绑定事件循环，循环变化时重建
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """获取通知器共享的异步 HTTP 客户端，首次使用时创建"""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(timeout=30, limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60))
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client():
+    """关闭通知器共享的 HTTP 客户端"""
+    global _http_client, _http_client_loop
+    if _http_client is not None and _http_client_loop is asyncio.get_running_loop():
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
 
 class BaseNotifier(ABC):
     """通知器抽象基类。"""
     name: str = "Base"
+    __slots__ = ('message_template',)
 
     # 默认 Markdown 消息模板
     DEFAULT_TEMPLATE = (
@@ -32,18 +63,24 @@ class BaseNotifier(ABC):
     # 公共方法
     # ------------------------------------------------------------------
 
-    def send(self, task_result: TaskResult):
-        """模板方法：提取数据 → 渲染消息 → 调用子类发送。"""
+    async def send(self, task_result: TaskResult, data: Optional[dict] = None):
+        """模板方法：提取数据 → 渲染消息 → 调用子类发送。
+
+        Args:
+            task_result: 任务结果。
+            data: 已提取的结构化字段，多个通知器共享同一结果时由调用方提取一次传入，不可修改。
+        """
         try:
             logger.info(f"推送 [{self.name}] 通知")
-            data = self._extract_data(task_result)
+            if data is None:
+                data = self._extract_data(task_result)
             message = self._render_message(data)
-            self._do_send(data, message)
+            await self._do_send(data, message)
         except Exception as e:
             logger.error(f"[{self.name}] 通知失败: {e}")
 
     @abstractmethod
-    def test(self):
+    async def test(self):
         """发送测试通知，子类实现。"""
         ...
 
@@ -52,7 +89,7 @@ class BaseNotifier(ABC):
     # ------------------------------------------------------------------
 
     @abstractmethod
-    def _do_send(self, data: dict, message: str):
+    async def _do_send(self, data: dict, message: str):
         """实际发送逻辑，由子类实现。
 
         Args:
@@ -69,17 +106,17 @@ class BaseNotifier(ABC):
     def _extract_data(task_result: TaskResult) -> dict:
         """从 TaskResult 提取通知所需的结构化字段。"""
         product = task_result["商品信息"]
-        analysis = task_result.get("分析结果", {}) or {}
-        images = product.get("商品图片列表", [])
-        link = f"https://h5.m.goofish.com/item?id={product['商品ID']}"
+        product_get = product.get
+        analysis_get = (task_result.get("分析结果") or _EMPTY).get
+        images = product_get("商品图片列表")
         return {
-            "title": str(product.get("商品标题", ""))[:20],
-            "price": product.get("当前售价", ""),
-            "origin_price": product.get("商品原价", ""),
-            "location": product.get("发货地区", ""),
-            "link": link,
-            "reason": analysis.get("原因", ""),
-            "score": analysis.get("推荐度", ""),
+            "title": str(product_get("商品标题", ""))[:20],
+            "price": product_get("当前售价", ""),
+            "origin_price": product_get("商品原价", ""),
+            "location": product_get("发货地区", ""),
+            "link": _ITEM_LINK_PREFIX + str(product["商品ID"]),
+            "reason": analysis_get("原因", ""),
+            "score": analysis_get("推荐度", ""),
             "image": images[0] if images else "",
         }
 
@@ -1,11 +1,30 @@
 """
 Notifier配置管理
 """
-import json
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
 from src.env import NOTIFIER_CONFIG_FILE
-from src.utils.file_operator import FileOperator
+from src.notify.template import get_notifier_secrecy_keys
+from src.utils.json_list_store import JsonListStore
+from src.utils.secrecy import secrecy_value
+
+_store = JsonListStore(NOTIFIER_CONFIG_FILE, first_id=1)
+
+# (已解析的配置列表, 脱敏后的配置列表)，解析缓存更新后重建
+_masked_notifiers: Tuple[Optional[List[Dict]], List[Dict]] = (None, [])
+
+
+def _mask_keys(notifier: Dict, secrecy_keys: List[str]) -> Dict:
+    masked = dict(notifier)
+    for key in secrecy_keys:
+        if masked.get(key):
+            masked[key] = secrecy_value(masked[key])
+    return masked
+
+
+def mask_notifier_config(notifier: Dict) -> Dict:
+    """返回敏感字段已脱敏的 Notifier 配置副本"""
+    return _mask_keys(notifier, get_notifier_secrecy_keys(notifier.get('type')))
 
 
 async def get_notifier_config(notifier_id: str) -> Optional[Dict]:
@@ -18,40 +37,48 @@ async def get_notifier_config(notifier_id: str) -> Optional[Dict]:
     Returns:
         Notifier配置对象或None
     """
-    notifier_file_op = FileOperator(NOTIFIER_CONFIG_FILE)
+    notifier = await _store.get(notifier_id)
+    return dict(notifier) if notifier else None
 
-    data_str = await notifier_file_op.read()
-    if not data_str:
-        return None
 
-    try:
-        notifiers = json.loads(data_str) if data_str else []
-        notifier = next((item for item in notifiers if isinstance(item, dict) and item.get('id') == notifier_id), None)
-        return notifier
+async def get_all_notifiers() -> List[Dict]:
+    """
+    从notifier.config文件获取所有Notifier配置
 
-    except json.JSONDecodeError as e:
-        raise ValueError(f"notifier.config文件JSON格式错误: {e}")
+    Returns:
+        Notifier配置对象列表（共享缓存，不可原地修改）
+    """
+    return await _store.get_all()
 
 
-async def get_all_notifiers() -> List[Dict]:
+async def get_all_notifiers_masked() -> List[Dict]:
     """
-    从notifier.config文件获取所有Notifier配置
+    获取所有脱敏后的Notifier配置（带缓存）
 
     Returns:
         Notifier配置对象列表
     """
-    notifier_file_op = FileOperator(NOTIFIER_CONFIG_FILE)
+    global _masked_notifiers
+    notifiers = await get_all_notifiers()
+    if _masked_notifiers[0] is not notifiers:
+        # 同类型的脱敏字段只解析一次
+        keys_by_type = {t: get_notifier_secrecy_keys(t) for t in {notifier.get('type') for notifier in notifiers}}
+        _masked_notifiers = (notifiers, [_mask_keys(notifier, keys_by_type[notifier.get('type')]) for notifier in notifiers])
+    return _masked_notifiers[1]
 
-    data_str = await notifier_file_op.read()
-    if not data_str:
-        return []
 
-    try:
-        notifiers = json.loads(data_str) if data_str else []
-        return notifiers
+async def get_notifier_config_masked(notifier_id: str) -> Optional[Dict]:
+    """
+    获取指定的脱敏Notifier配置（带缓存）
+
+    Args:
+        notifier_id: Notifier ID
 
-    except json.JSONDecodeError as e:
-        raise ValueError(f"notifier.config文件JSON格式错误: {e}")
+    Returns:
+        Notifier配置对象或None
+    """
+    notifiers = await get_all_notifiers_masked()
+    return next((item for item in notifiers if isinstance(item, dict) and item.get('id') == notifier_id), None)
 
 
 async def get_enabled_notifiers() -> List[Dict]:
@@ -75,27 +102,7 @@ async def add_notifier_config(notifier_config: Dict) -> Dict:
     Returns:
         添加的Notifier配置对象
     """
-    notifier_file_op = FileOperator(NOTIFIER_CONFIG_FILE)
-
-    data_str = await notifier_file_op.read()
-    data = json.loads(data_str) if data_str else []
-
-    max_id = 0
-    if data:
-        try:
-            max_id = max(int(item['id']) for item in data if item.get('id').isdigit())
-        except (ValueError, TypeError):
-            max_id = 0
-
-    notifier_id = str(max_id + 1)
-
-    notifier_config['id'] = notifier_id
-
-    data.append(notifier_config)
-
-    await notifier_file_op.write(json.dumps(data, ensure_ascii=False, indent=2))
-
-    return notifier_config
+    return await _store.add(notifier_config)
 
 
 async def update_notifier_config(notifier_id: str, notifier_update: Dict, exclude: set[str] = None) -> Dict:
@@ -109,25 +116,14 @@ async def update_notifier_config(notifier_id: str, notifier_update: Dict, exclud
     Returns:
         更新后的Notifier配置对象
     """
-    notifier_file_op = FileOperator(NOTIFIER_CONFIG_FILE)
-
-    data_str = await notifier_file_op.read()
-    data = json.loads(data_str) if data_str else []
-
-    notifier_index = next((i for i, item in enumerate(data) if item.get('id') == notifier_id), -1)
-
-    if notifier_index == -1:
-        raise ValueError(f"Notifier ID {notifier_id} 不存在")
-
     exclude = ({"id"} | exclude) if exclude else {"id"}
 
     for exclude_item in exclude:
         notifier_update.pop(exclude_item, None)
 
-    notifier = data[notifier_index]
-    notifier.update(notifier_update)
-
-    await notifier_file_op.write(json.dumps(data, ensure_ascii=False, indent=2))
+    notifier = await _store.update(notifier_id, notifier_update)
+    if notifier is None:
+        raise ValueError(f"Notifier ID {notifier_id} 不存在")
 
     return notifier
 
@@ -142,21 +138,4 @@ async def remove_notifier_config(notifier_id: str) -> Optional[Dict]:
     Returns:
         删除的Notifier配置对象或None
     """
-    notifier_file_op = FileOperator(NOTIFIER_CONFIG_FILE)
-
-    data_str = await notifier_file_op.read()
-    data = json.loads(data_str) if data_str else []
-
-    notifier_index = next((i for i, item in enumerate(data) if item.get('id') == notifier_id), -1)
-
-    if notifier_index == -1:
-        return None
-
-    removed_notifier = data.pop(notifier_index)
-
-    await notifier_file_op.write(json.dumps(data, ensure_ascii=False, indent=2))
-
-    try:
-        return removed_notifier
-    except Exception:
-        return None
+    return await _store.remove(notifier_id)
@@ -1,28 +1,33 @@
 import httpx
+import orjson
 
-from src.notify.base import BaseNotifier
+from src.notify.base import BaseNotifier, get_http_client
 from src.types import GotifyConfig
 from src.utils.logger import logger
 
+_TIMEOUT = httpx.Timeout(10)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class GotifyNotifier(BaseNotifier):
     name = "Gotify"
+    __slots__ = ('server_url', 'token', '_url')
 
     def __init__(self, config: GotifyConfig):
         super().__init__(config)
         self.server_url = config.get('url', '').rstrip('/')
         self.token = config.get('token', '')
+        self._url = f"{self.server_url}/message?token={self.token}"
 
-    def test(self):
-        url = f"{self.server_url}/message?token={self.token}"
-        httpx.post(url, content='你好，准备好接受推荐了吗', timeout=10)
+    async def test(self):
+        await get_http_client().post(self._url, content='你好，准备好接受推荐了吗', timeout=_TIMEOUT)
 
-    def _do_send(self, data: dict, message: str):
-        url = f"{self.server_url}/message?token={self.token}"
+    async def _do_send(self, data: dict, message: str):
         logger.info(f"推送 [Gotify] 通知，地址为：{self.server_url}/message?token=**********")
         payload = {
             'title': data['title'],
             'message': message,
             'priority': 5
         }
-        httpx.post(url, json=payload, timeout=10)
+        await get_http_client().post(self._url, content=orjson.dumps(payload), headers=_JSON_HEADERS,
+                                     timeout=_TIMEOUT)
@@ -1,4 +1,5 @@
-from typing import Optional, List, Dict
+import asyncio
+from typing import Optional, List, Dict, Type
 
 from src.notify.base import BaseNotifier
 from src.notify.config import get_enabled_notifiers
@@ -8,6 +9,16 @@ from src.notify.wechat_service import WechatWebhookNotifier
 from src.notify.serverchan import ServerChanNotifier
 from src.notify.webhook import WebhookNotifier
 from src.types import TaskResult, NotificationConfig
+from src.utils.logger import logger
+
+# 通知类型 -> 通知器类
+_NOTIFIER_REGISTRY: Dict[str, Type[BaseNotifier]] = {
+    'ntfy': NtfyNotifier,
+    'gotify': GotifyNotifier,
+    'wechat': WechatWebhookNotifier,
+    'serverchan': ServerChanNotifier,
+    'webhook': WebhookNotifier,
+}
 
 
 class NotificationManager:
@@ -20,28 +31,29 @@ class NotificationManager:
                 if notifier:
                     self.notifiers.append(notifier)
 
-    def notify(self, task_result: TaskResult):
-        analysis = task_result.get('分析结果', {})
-        if analysis.get('推荐度', 0) < self.threshold:
+    async def notify(self, task_result: TaskResult):
+        if not self.notifiers:
+            return
+
+        analysis = task_result.get('分析结果')
+        score = analysis.get('推荐度', 0) if analysis else 0
+        if score < self.threshold:
+            return
+
+        # 各通知器共享同一份提取结果
+        try:
+            data = BaseNotifier._extract_data(task_result)
+        except Exception as e:
+            logger.error(f"通知数据提取失败: {e}")
             return
 
-        for notifier in self.notifiers:
-            notifier.send(task_result)
+        # send 内部已处理异常，各通知渠道并发推送
+        await asyncio.gather(*(notifier.send(task_result, data) for notifier in self.notifiers))
 
     @staticmethod
     def create_notifier(config: dict) -> Optional[BaseNotifier]:
-        notif_type = config.get('type')
-        if notif_type == 'ntfy':
-            return NtfyNotifier(config)
-        if notif_type == 'gotify':
-            return GotifyNotifier(config)
-        if notif_type == 'wechat':
-            return WechatWebhookNotifier(config)
-        if notif_type == 'serverchan':
-            return ServerChanNotifier(config)
-        if notif_type == 'webhook':
-            return WebhookNotifier(config)
-        return None
+        notifier_cls = _NOTIFIER_REGISTRY.get(config.get('type'))
+        return notifier_cls(config) if notifier_cls else None
 
     @classmethod
     async def create_from_config(cls, config: NotificationConfig) -> "NotificationManager | None":
@@ -1,22 +1,24 @@
-import httpx
+from bisect import bisect_right
 
-from src.notify.base import BaseNotifier
+from src.notify.base import BaseNotifier, get_http_client
 from src.types import NtfyConfig
 
+_TEST_PAYLOAD = '你好，准备好接受推荐了吗'.encode('utf-8')
+_ACTION_PREFIX = 'view, 查看, '.encode('utf-8')
+
+
+# 推荐度分段下界及对应标签
+_SCORE_THRESHOLDS = (30, 60, 80)
+_SCORE_TAGS = ('-1', 'warning', '+1', '+1,+1')
+
 
 def score_tags(score: int):
-    if score >= 80:
-        return '+1,+1'
-    elif score >= 60:
-        return '+1'
-    elif score >= 30:
-        return 'warning'
-    else:
-        return '-1'
+    return _SCORE_TAGS[bisect_right(_SCORE_THRESHOLDS, score)]
 
 
 class NtfyNotifier(BaseNotifier):
     name = "Ntfy"
+    __slots__ = ('topic_url',)
 
     def __init__(self, config: NtfyConfig):
         super().__init__(config)
@@ -27,10 +29,10 @@ class NtfyNotifier(BaseNotifier):
             'AI分析：{reason} \n'
         )
 
-    def test(self):
-        httpx.post(self.topic_url, content='你好，准备好接受推荐了吗', timeout=30)
+    async def test(self):
+        await get_http_client().post(self.topic_url, content=_TEST_PAYLOAD, timeout=30)
 
-    def _do_send(self, data: dict, message: str):
+    async def _do_send(self, data: dict, message: str):
         score = data['score']
         tags = score_tags(score) if isinstance(score, (int, float)) else ''
         image = data.get('image', None)
@@ -42,6 +44,6 @@ class NtfyNotifier(BaseNotifier):
         if image:
             headers['Attach'] = image
         if data['link']:
-            headers['Actions'] = f'view, 查看, {data["link"]}'.encode('utf-8')
+            headers['Actions'] = _ACTION_PREFIX + data['link'].encode('utf-8')
 
-        httpx.post(self.topic_url, content=message.encode('utf-8'), headers=headers, timeout=30)
+        await get_http_client().post(self.topic_url, content=message.encode('utf-8'), headers=headers, timeout=30)
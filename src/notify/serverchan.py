@@ -3,14 +3,18 @@
 """
 import re
 
-import httpx
+import orjson
 
-from src.notify.base import BaseNotifier
+from src.notify.base import BaseNotifier, get_http_client
 from src.types import ServerChanConfig
 
+_SCTP_RE = re.compile(r'^sctp(\d+)t')
+_HEADERS = {"Content-Type": "application/json;charset=utf-8"}
+
 
 class ServerChanNotifier(BaseNotifier):
     name = "ServerChan"
+    __slots__ = ('sendkey', 'noip', 'channel', 'openid', '_url', '_extra')
 
     def __init__(self, config: ServerChanConfig):
         super().__init__(config)
@@ -18,19 +22,27 @@ class ServerChanNotifier(BaseNotifier):
         self.noip = config.get('noip')
         self.channel = config.get('channel')
         self.openid = config.get('openid')
+        # 配置不变，推送地址与附加参数只计算一次
+        self._url = self._compute_url()
+        self._extra = self._extra_params()
 
-    def _get_url(self) -> str:
+    def _compute_url(self) -> str | None:
         if self.sendkey.startswith('sctp'):
-            match = re.search(r'^sctp(\d+)t', self.sendkey)
+            match = _SCTP_RE.search(self.sendkey)
             if match:
                 # group(1) 对应第一个括号内匹配到的数字内容
                 num_part = match.group(1)
                 return f'https://{num_part}.push.ft07.com/send/{self.sendkey}.send'
-            else:
-                raise ValueError('Invalid sendkey format')
+            return None
 
         return f"https://sctapi.ftqq.com/{self.sendkey}.send"
 
+    def _get_url(self) -> str:
+        # sendkey 格式错误时在推送/测试时报错，不影响其他通知器的创建
+        if self._url is None:
+            raise ValueError('Invalid sendkey format')
+        return self._url
+
     def _extra_params(self) -> dict:
         params = {}
         if self.noip:
@@ -45,26 +57,26 @@ class ServerChanNotifier(BaseNotifier):
             params['openid'] = self.openid
         return params
 
-    def test(self):
-        resp = httpx.post(
+    async def test(self):
+        resp = await get_http_client().post(
             self._get_url(),
-            json={"title": "测试通知", "desp": "你好，准备好接受推荐了吗", **self._extra_params()},
-            headers={"Content-Type": "application/json;charset=utf-8"},
+            content=orjson.dumps({"title": "测试通知", "desp": "你好，准备好接受推荐了吗", **self._extra}),
+            headers=_HEADERS,
             timeout=30,
         )
-        data = resp.json()
+        data = orjson.loads(resp.content)
         if data.get("code") != 0:
             raise RuntimeError(f"Server酱推送失败: {data.get('message', resp.text[:200])}")
 
-    def _do_send(self, data: dict, message: str):
+    async def _do_send(self, data: dict, message: str):
         title = data['title']
-        resp = httpx.post(
+        resp = await get_http_client().post(
             self._get_url(),
-            json={"title": title, "desp": message, **self._extra_params()},
-            headers={"Content-Type": "application/json;charset=utf-8"},
+            content=orjson.dumps({"title": title, "desp": message, **self._extra}),
+            headers=_HEADERS,
             timeout=30,
         )
-        resp_data = resp.json()
+        resp_data = orjson.loads(resp.content)
         if resp_data.get("code") != 0:
             from src.utils.logger import logger
             logger.error("[ServerChan] 推送失败: {}", resp_data.get("message", resp.text[:200]))
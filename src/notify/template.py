@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 from src.notify.base import BaseNotifier
 
 
+@lru_cache(maxsize=1)
 def get_notifier_templates():
     default_message_template = BaseNotifier.DEFAULT_TEMPLATE
     message_template_help = (
@@ -161,3 +164,9 @@ def get_notifier_templates():
             },
         }
     ]
+
+
+def get_notifier_secrecy_keys(notifier_type: str) -> list[str]:
+    """获取指定通知类型中需要脱敏的字段"""
+    template = next((it for it in get_notifier_templates() if it['type'] == notifier_type), {})
+    return [key for key, value in template.get('template', {}).items() if value.get('type', '') == 'password']
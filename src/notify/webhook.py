@@ -1,11 +1,10 @@
 """通用 Webhook 通知器。
 支持自定义 URL、Headers 和消息模板。
 """
-import json
-
 import httpx
+import orjson
 
-from src.notify.base import BaseNotifier
+from src.notify.base import BaseNotifier, get_http_client
 from src.utils.logger import logger
 
 
@@ -16,21 +15,23 @@ class WebhookNotifier(BaseNotifier):
     支持自定义请求头（Headers），适用于需要鉴权或特殊头的场景。
     """
     name = "Webhook"
+    __slots__ = ('webhook_url', 'headers', '_post_headers')
 
     def __init__(self, config: dict):
         super().__init__(config)
         self.webhook_url: str = config.get('url', '').rstrip('/')
         self.headers: dict = self._parse_headers(config.get('headers', ''))
+        self._post_headers: dict = {"Content-Type": "application/json", **self.headers}
 
     # ------------------------------------------------------------------
     # 公共方法
     # ------------------------------------------------------------------
 
-    def test(self):
+    async def test(self):
         payload = {"content": "你好，准备好接受推荐了吗"}
-        self._post_json(self.webhook_url, payload)
+        await self._post_json(self.webhook_url, payload)
 
-    def _do_send(self, data: dict, message: str):
+    async def _do_send(self, data: dict, message: str):
         logger.info(f"推送 [Webhook] 通知，地址为：{self.webhook_url}")
         payload = {
             "title": data.get("title", ""),
@@ -38,19 +39,19 @@ class WebhookNotifier(BaseNotifier):
             "link": data.get("link", ""),
             "score": data.get("score", ""),
         }
-        self._post_json(self.webhook_url, payload)
+        await self._post_json(self.webhook_url, payload)
 
     # ------------------------------------------------------------------
     # 内部工具
     # ------------------------------------------------------------------
 
-    def _post_json(self, url: str, payload: dict, timeout: int = 30) -> httpx.Response:
+    async def _post_json(self, url: str, payload: dict, timeout: int = 30) -> httpx.Response:
         """发送 JSON POST 请求，携带自定义 Headers。"""
         if not url:
             raise ValueError(f"{self.name} webhook url 不能为空")
 
-        headers = {"Content-Type": "application/json", **self.headers}
-        resp = httpx.post(url, json=payload, headers=headers, timeout=timeout)
+        resp = await get_http_client().post(url, content=orjson.dumps(payload), headers=self._post_headers,
+                                            timeout=timeout)
 
         if resp.status_code >= 400:
             logger.error(
@@ -68,9 +69,9 @@ class WebhookNotifier(BaseNotifier):
         if not raw or not raw.strip():
             return {}
         try:
-            parsed = json.loads(raw)
+            parsed = orjson.loads(raw)
             if isinstance(parsed, dict):
                 return {str(k): str(v) for k, v in parsed.items()}
-        except (json.JSONDecodeError, TypeError):
+        except (orjson.JSONDecodeError, TypeError):
             logger.warning(f"[Webhook] Headers 解析失败，已忽略: {raw[:100]}")
         return {}
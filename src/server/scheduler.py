@@ -3,6 +3,7 @@ import os
 import signal
 import subprocess
 import sys
+from dataclasses import dataclass
 from typing import Optional
 
 from apscheduler.jobstores.base import JobLookupError
@@ -15,9 +16,15 @@ from src.task.task import get_tasks, Task
 from src.utils.date import now_str
 from src.utils.logger import logger
 
-# 任务进程表与运行状态缓存
-scraper_processes: dict[int, int] = {}
-running_tasks: dict[int, bool] = {}
+
+@dataclass
+class RunningTask:
+    """运行中任务的记录，登记即表示任务处于运行状态"""
+    pid: Optional[int] = None  # 子进程启动前为 None
+
+
+# 任务ID -> 运行记录
+_tasks: dict[int, RunningTask] = {}
 scheduler = AsyncIOScheduler(timezone="Asia/Shanghai")
 
 # 并发限制（同时运行的任务数）
@@ -121,20 +128,18 @@ def _wait_for_process_exit(pid: int, timeout: float = 3.0) -> bool:
 
 def terminate_process(task_id: int) -> bool:
     """终止指定 task_id 的子进程；返回值表示**此前**该任务是否处于运行状态。"""
-    pid = scraper_processes.get(task_id)
-    if pid is None:
-        logger.debug(f"终止进程: 任务 {task_id} 无进程PID记录")
-        was_running = running_tasks.get(task_id, False)
-        running_tasks.pop(task_id, None)
-        return was_running
-
-    was_running = running_tasks.get(task_id, False) or _is_process_alive(pid)
+    record = _tasks.get(task_id)
+    if record is None:
+        logger.debug(f"终止进程: 任务 {task_id} 无运行记录")
+        return False
 
+    pid = record.pid
     if not pid:
-        running_tasks.pop(task_id, None)
-        scraper_processes.pop(task_id, None)
+        _tasks.pop(task_id, None)
         logger.debug(f"终止进程: 任务 {task_id} 无进程PID")
-        return was_running
+        return True
+
+    was_running = _is_process_alive(pid)
 
     logger.info(f"正在终止任务 {task_id} 的进程 (PID: {pid})")
 
@@ -177,8 +182,7 @@ def terminate_process(task_id: int) -> bool:
     except Exception as e:
         logger.error(f"终止进程 {pid} 时发生错误: {e}")
     finally:
-        running_tasks.pop(task_id, None)
-        scraper_processes.pop(task_id, None)
+        _tasks.pop(task_id, None)
         logger.info(f"任务 {task_id} 已停止")
 
     return was_running
@@ -223,7 +227,7 @@ def shutdown_task_scheduler():
             scheduler.shutdown()
             logger.info("调度器已关闭")
 
-        task_ids = list(set(list(running_tasks.keys()) + list(scraper_processes.keys())))
+        task_ids = list(_tasks)
         logger.info(f"正在终止 {len(task_ids)} 个运行中的任务")
 
         for task_id in task_ids:
@@ -237,25 +241,16 @@ def shutdown_task_scheduler():
 
 
 def is_task_running(task_id: int) -> bool:
-    if running_tasks.get(task_id, False):
-        logger.debug(f"任务 {task_id} 在运行状态缓存中标记为运行中")
+    if task_id in _tasks:
+        logger.debug("任务 {} 在运行记录中标记为运行中", task_id)
         return True
-    pid = scraper_processes.get(task_id)
-    if pid is None:
-        logger.debug(f"任务 {task_id} 无PID记录，认为未运行")
-        return False
-    is_alive = _is_process_alive(pid)
-    if is_alive:
-        logger.debug(f"任务 {task_id} 的进程 (PID: {pid}) 存活")
-    else:
-        logger.debug(f"任务 {task_id} 的进程 (PID: {pid}) 未存活，清理记录")
-        scraper_processes.pop(task_id, None)
-    return is_alive
+    logger.debug("任务 {} 无运行记录，认为未运行", task_id)
+    return False
 
 
 def get_all_running_tasks() -> dict[int, bool]:
-    logger.debug(f"获取所有运行中任务: 当前 {len(running_tasks)} 个")
-    return running_tasks.copy()
+    logger.debug("获取所有运行中任务: 当前 {} 个", len(_tasks))
+    return dict.fromkeys(_tasks, True)
 
 
 async def run_task(task_id: int, task_name: str):
@@ -265,19 +260,21 @@ async def run_task(task_id: int, task_name: str):
     logger.info(f"任务执行开始时间: {now_str()}")
     logger.info_file(logs_file, f"任务触发执行: name={task_name}, id={task_id}")
 
-    if is_task_running(task_id):
+    running = _tasks.get(task_id)
+    if running is not None:
         logger.warning(f"任务 '{task_name}' (ID: {task_id}) 已在运行中，跳过此次执行")
-        logger.info(f"跳过执行原因: 任务已在运行状态，PID={scraper_processes.get(task_id)}")
+        logger.info(f"跳过执行原因: 任务已在运行状态，PID={running.pid}")
         logger.warning_file(logs_file, f"任务跳过: 任务已在运行中, id={task_id}")
         return
 
-    running_tasks[task_id] = True
+    record = _tasks[task_id] = RunningTask()
 
     try:
         async with semaphore:
             logger.debug(f"获取信号量: 任务 {task_id} 开始执行")
 
-            if not running_tasks[task_id]:
+            # 等待期间被终止时记录已移除（或已被新一轮执行替换）
+            if _tasks.get(task_id) is not record:
                 logger.warning(f"任务 '{task_name}' (ID: {task_id}) 已取消, 中断执行")
                 return
 
@@ -293,7 +290,7 @@ async def run_task(task_id: int, task_name: str):
                     stderr=asyncio.subprocess.STDOUT
                 )
 
-            scraper_processes[task_id] = process.pid
+            record.pid = process.pid
             logger.info(f"爬虫子进程已启动: PID={process.pid}, 任务ID={task_id}")
             logger.info(f"子进程命令: {sys.executable} -u start_spider.py --task-id {task_id}")
             logger.info_file(logs_file, f"子进程已启动: pid={process.pid}, task_id={task_id}")
@@ -312,7 +309,7 @@ async def run_task(task_id: int, task_name: str):
         execution_time = asyncio.get_event_loop().time() - start_time
         logger.warning(f"任务 '{task_name}' (ID: {task_id}) 被取消，执行耗时: {execution_time:.2f}秒")
         logger.warning_file(logs_file, f"任务被取消: duration={execution_time:.2f}s")
-        if task_id in scraper_processes:
+        if record.pid is not None and _tasks.get(task_id) is record:
             terminate_process(task_id)
         raise
     except Exception as e:
@@ -322,8 +319,9 @@ async def run_task(task_id: int, task_name: str):
         logger.error_file(logs_file, f"任务执行错误: {type(e).__name__}: {e}, duration={execution_time:.2f}s")
         raise
     finally:
-        running_tasks.pop(task_id, None)
-        scraper_processes.pop(task_id, None)
+        # 只清理本次执行的记录，不影响终止后重新触发的执行
+        if _tasks.get(task_id) is record:
+            del _tasks[task_id]
         logger.info(f"任务 {task_id} 执行完成，状态已清理，总耗时: {(asyncio.get_event_loop().time() - start_time):.2f}秒")
         logger.info_file(logs_file, f"任务执行结束: task_id={task_id}, total_duration={(asyncio.get_event_loop().time() - start_time):.2f}s")
 
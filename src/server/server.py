@@ -1,6 +1,4 @@
-import hashlib
 import os
-import secrets
 from contextlib import asynccontextmanager
 
 import uvicorn
@@ -8,8 +6,10 @@ from fastapi import FastAPI, Request, HTTPException
 from starlette.responses import FileResponse, HTMLResponse
 from starlette.staticfiles import StaticFiles
 
+from src.api.ai import close_ai_clients
 from src.api.router import api_router
-from src.env import SECRET_KEY_FILE, SERVER_PORT, WEB_PASSWORD
+from src.notify.base import close_http_client
+from src.env import SERVER_PORT
 from src.server.scheduler import initialize_task_scheduler, shutdown_task_scheduler
 from src.utils.browser import check_browser_purity
 from src.utils.logger import logger
@@ -24,21 +24,10 @@ async def lifespan(app: FastAPI):
 
     logger.info("Web服务器正在关闭，正在终止所有爬虫进程...")
     shutdown_task_scheduler()
+    await close_ai_clients()
+    await close_http_client()
 
 
-def load_or_create_secret_key():
-    if os.path.exists(SECRET_KEY_FILE):
-        with open(SECRET_KEY_FILE, "r", encoding="utf-8") as f:
-            return f.read().strip()
-    else:
-        key = secrets.token_urlsafe(50)
-        with open(SECRET_KEY_FILE, "w", encoding="utf-8") as f:
-            f.write(key)
-        return key
-
-
-# 计算密码的MD5值（与原始逻辑一致）
-WEB_PASSWORD_MD5 = hashlib.md5(WEB_PASSWORD.encode('utf-8')).hexdigest()
 DEV = os.getenv("DEV", "0").lower() == "1"
 
 # 创建FastAPI应用
@@ -86,7 +75,8 @@ async def index(request: Request, path: str):
 
 def start_server():
     logger.info(f"启动 Web 管理界面，请在浏览器访问 http://127.0.0.1:{SERVER_PORT}")
-    uvicorn.run(app, host="0.0.0.0", port=SERVER_PORT)
+    # uvloop 不支持 Windows，loop 使用 auto 在可用时自动启用
+    uvicorn.run(app, host="0.0.0.0", port=SERVER_PORT, loop="auto", http="httptools")
 
 
 if __name__ == "__main__":
@@ -14,6 +14,7 @@ from src.account.login import try_auto_login
 from src.agent.product_evaluator import ProductEvaluator
 from src.config import get_config_instance
 from src.env import STATE_FILE, RUNNING_IN_DOCKER
+from src.notify.base import close_http_client
 from src.notify.notify_manager import NotificationManager
 from src.utils.browser import create_browser
 from src.spider.parsers import parse_product_info_and_seller_info, parse_seller_detail_info
@@ -311,7 +312,7 @@ class GoofishSpider:
 
         if self.notification_manager:
             logger.info("开始推送通知")
-            self.notification_manager.notify(final_record)
+            await self.notification_manager.notify(final_record)
 
     async def run(self) -> Tuple[Literal['normal', 'abnormal', 'risk'], int]:
         """执行爬虫任务"""
@@ -483,6 +484,7 @@ async def main(debug: bool = False):
         coroutines.append(spider.run())
 
     results = await asyncio.gather(*coroutines, return_exceptions=True)
+    await close_http_client()
 
     logger.info("所有任务执行完毕")
 
@@ -1,13 +1,19 @@
 import os
 import re
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
+
+import aiofiles
 
 from src.env import LOGS_DIR
 from src.types import TaskLogEntry
 from src.utils.logger import logger
 
 _LOG_LINE_PATTERN = re.compile(r'^\[([^]]+)] \[([^]]+)] (.+)$')
+_LOG_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+_LOG_TIME_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+# 按块读取日志，避免逐行切换线程
+_READ_BLOCK_SIZE = 64 * 1024
 
 
 def get_logs_file_name(task_id: int) -> str:
@@ -44,14 +50,28 @@ def parse_log_line(line: str, task_id: int) -> Optional[TaskLogEntry]:
     )
 
 
-async def get_task_logs(
+async def _iter_line_batches(f) -> AsyncIterator[List[str]]:
+    """按块读取文本文件，每次产出一批完整的行"""
+    pending = ''
+    while True:
+        block = await f.read(_READ_BLOCK_SIZE)
+        if not block:
+            if pending:
+                yield [pending]
+            return
+        *lines, pending = (pending + block).split('\n')
+        if lines:
+            yield lines
+
+
+async def iter_task_logs(
         task_id: int,
         from_time: Optional[datetime] = None,
         limit: Optional[int] = None,
         level_filter: Optional[List[str]] = None
-) -> List[TaskLogEntry]:
+) -> AsyncIterator[TaskLogEntry]:
     """
-    从指定时间点之后获取日志（最多 limit 条）
+    逐条读取指定时间点之后的日志（最多 limit 条）
 
     Args:
         task_id: 任务ID
@@ -59,49 +79,61 @@ async def get_task_logs(
         limit: 返回条数上限，None 表示不限制
         level_filter: 日志级别过滤
 
-    Returns:
-        List[TaskLogEntry]
+    Yields:
+        TaskLogEntry
     """
     filename = get_logs_file_name(task_id)
-    logs: List[TaskLogEntry] = []
 
     if not os.path.exists(filename):
-        return logs
+        return
 
     level_set = set(level_filter) if level_filter else None
+    # 日志时间为定长格式，直接按字符串比较，无需逐行 strptime
+    from_time_str = from_time.strftime(_LOG_TIME_FORMAT) if from_time is not None else None
+    count = 0
 
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            for log_id, line in enumerate(f, start=1):
-                log_entry = parse_log_line(line, task_id)
-                if log_entry is None:
-                    continue
-
-                if level_set and log_entry.get('level') not in level_set:
-                    continue
-
-                if from_time is not None:
-                    try:
-                        log_time = datetime.strptime(
-                            log_entry.get('timestamp'),
-                            "%Y-%m-%d %H:%M:%S"
-                        )
-                    except ValueError:
+        async with aiofiles.open(filename, 'r', encoding='utf-8') as f:
+            log_id = 0
+            async for lines in _iter_line_batches(f):
+                for line in lines:
+                    log_id += 1
+                    log_entry = parse_log_line(line, task_id)
+                    if log_entry is None:
                         continue
 
-                    if log_time <= from_time:
+                    if level_set and log_entry.get('level') not in level_set:
                         continue
 
-                log_entry['id'] = log_id
-                logs.append(log_entry)
+                    if from_time_str is not None:
+                        timestamp = log_entry.get('timestamp')
+                        if not _LOG_TIME_PATTERN.match(timestamp) or timestamp <= from_time_str:
+                            continue
 
-                if limit is not None and len(logs) >= limit:
-                    break
+                    log_entry['id'] = log_id
+                    yield log_entry
+                    count += 1
+
+                    if limit is not None and count >= limit:
+                        return
 
     except Exception as e:
         logger.error(f"读取任务日志失败: {e}")
 
-    return logs
+
+async def get_task_logs(
+        task_id: int,
+        from_time: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        level_filter: Optional[List[str]] = None
+) -> List[TaskLogEntry]:
+    """
+    从指定时间点之后获取日志（最多 limit 条）
+
+    Returns:
+        List[TaskLogEntry]
+    """
+    return [log async for log in iter_task_logs(task_id, from_time, limit, level_filter)]
 
 
 def trim_log_file(path: str, max_size: int, keep_ratio: float = 0.6, encoding="utf-8"):
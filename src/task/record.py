@@ -1,5 +1,5 @@
 import json
-from typing import Literal
+from typing import Dict, Literal
 
 from src.env import TASKS_RECORD_FILE
 from src.types import TaskRecord
@@ -15,6 +15,16 @@ async def get_task_record(task_id: int) -> TaskRecord | None:
     return next((it for it in data if it['task_id'] == task_id), None)
 
 
+async def get_task_records() -> Dict[int, TaskRecord]:
+    """一次读取所有任务的运行记录，按 task_id 索引"""
+    record_file_op = FileOperator(TASKS_RECORD_FILE)
+
+    data_str = await record_file_op.read()
+    data = json.loads(data_str) if data_str else []
+
+    return {it['task_id']: it for it in data}
+
+
 async def add_task_record(task_id: int, runed: Literal['normal', 'abnormal', 'risk']) -> TaskRecord:
     record_file_op = FileOperator(TASKS_RECORD_FILE)
 
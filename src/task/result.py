@@ -1,7 +1,9 @@
+import asyncio
+import heapq
 import json
 import os
 from collections import defaultdict
-from typing import Literal, Optional
+from typing import Callable, List, Literal, Optional, Tuple
 
 import aiofiles
 
@@ -38,6 +40,31 @@ def remove_task_result(task_id: int):
         logger.error(f"删除任务结果文件失败: task_id={task_id}, error={e}")
 
 
+def _select_task_results(
+        filename: str,
+        count: int,
+        recommended_only: bool,
+        sort_key: Callable[[dict], object],
+        desc: bool) -> Tuple[int, List[TaskResult]]:
+    """逐行读取结果文件，只在内存中保留排序后的前 count 条，返回 (总数, 结果)"""
+    total = 0
+
+    def iter_records():
+        nonlocal total
+        with open(filename, 'r', encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                if recommended_only and not record.get("分析结果", {}).get("推荐度") >= 60:
+                    continue
+                total += 1
+                yield record
+
+    # 与完整排序后切片结果一致（包括相同排序键的先后顺序）
+    select = heapq.nlargest if desc else heapq.nsmallest
+    selected = select(count, iter_records(), key=sort_key)
+    return total, selected
+
+
 async def get_task_result(
         task_id: int,
         page: int,
@@ -45,7 +72,6 @@ async def get_task_result(
         recommended_only: Optional[bool] = False,
         sort_by: Optional[TaskResultSortBy] = TaskResultSortBy.CRAWL_TIME,
         order: Optional[Literal['asce', 'desc']] = "asce") -> TaskResultPagination:
-    results = []
     filename = get_result_filename(task_id)
 
     if not os.path.exists(filename):
@@ -65,21 +91,12 @@ async def get_task_result(
         else:
             return item.get("爬取时间", "")
 
-    async with aiofiles.open(filename, 'r', encoding='utf-8') as f:
-        async for line in f:
-            record = json.loads(line)
-            if recommended_only:
-                if record.get("分析结果", {}).get("推荐度") >= 60:
-                    results.append(record)
-            else:
-                results.append(record)
-
-    results.sort(key=get_sort_key, reverse=order == 'desc')
-
-    total_items = len(results)
     start = (page - 1) * limit
     end = start + limit
-    paginated_results = results[start:end]
+    total_items, selected = await asyncio.to_thread(
+        _select_task_results, filename, end, recommended_only, get_sort_key, order == 'desc'
+    )
+    paginated_results = selected[start:]
 
     return {
         "total": total_items,
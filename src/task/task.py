@@ -6,7 +6,13 @@ from src.task.logs import remove_logs_file
 from src.task.record import remove_task_record
 from src.task.result import remove_task_result
 from src.types import Task
-from src.utils.file_operator import FileOperator
+from src.utils.file_operator import FileOperator, read_json_cached
+
+
+async def _load_tasks() -> List[Task]:
+    # 按文件状态缓存解析结果，外部修改 tasks.json 后也会重新读取
+    data = await read_json_cached(TASKS_CONFIG_FILE)
+    return data or []
 
 
 async def add_task(task: Task) -> Task:
@@ -52,15 +58,12 @@ async def update_task(task_update: Task) -> Task:
 
 
 async def get_task(task_id: int) -> Optional[Task]:
-    task_file_op = FileOperator(TASKS_CONFIG_FILE)
-
-    data_str = await task_file_op.read()
-
-    data = json.loads(data_str) if data_str else []
+    data = await _load_tasks()
 
     task = next((it for it in data if it['task_id'] == task_id), None)
 
-    return task
+    # 返回副本，调用方可以自由修改
+    return dict(task) if task else None
 
 
 async def remove_task(task_id: int) -> Optional[Task]:
@@ -88,10 +91,8 @@ async def remove_task(task_id: int) -> Optional[Task]:
 
 
 async def get_tasks() -> List[Task]:
-    task_file_op = FileOperator(TASKS_CONFIG_FILE)
-    data_str = await task_file_op.read()
-    data = json.loads(data_str) if data_str else []
-    return data
+    data = await _load_tasks()
+    return [dict(it) for it in data]
 
 
 '''
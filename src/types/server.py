@@ -3,7 +3,7 @@ Server 相关类型定义
 """
 from typing import Optional, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from src.types.task import TaskResultSortBy
 
@@ -34,8 +34,8 @@ class GoofishLoginRequest(BaseModel):
     code: Optional[str] = None
 
 class PaginationOptions(BaseModel):
-    page: Optional[int] = 1
-    limit: Optional[int]
+    page: Optional[int] = Field(1, ge=1)
+    limit: Optional[int] = Field(..., ge=1)
     recommended_only: Optional[bool]
     sort_by: Optional[TaskResultSortBy]
     order: Optional[Literal['asce', 'desc']]
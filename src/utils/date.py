@@ -14,3 +14,7 @@ def now_timestamp():
 
 def now_str():
     return now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def from_timestamp(timestamp: float):
+    return datetime.fromtimestamp(timestamp, _zone_info)
@@ -1,8 +1,13 @@
 import aiofiles
+import aiofiles.os
+import orjson
 from pathlib import Path
 import asyncio
 import os
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+
+# 已解析的 JSON 文件缓存: 绝对路径 -> ((mtime_ns, size, inode), 数据)
+_json_cache: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
 
 
 async def cleanup_temp_file(temp_path: str):
@@ -43,7 +48,7 @@ class FileOperator:
             try:
                 async with aiofiles.open(temp_path, 'w', encoding='utf-8') as f:
                     await f.write(content)
-                os.replace(temp_path, self.filepath)
+                await aiofiles.os.replace(temp_path, self.filepath)
 
             except PermissionError as e:
                 await cleanup_temp_file(temp_path)
@@ -61,3 +66,42 @@ class FileOperator:
                 raise PermissionError(f"没有权限删除文件 {self.filepath}") from e
             except (IOError, OSError) as e:
                 raise IOError(f"删除文件 {self.filepath} 时发生错误: {e}") from e
+
+
+async def read_json_cached(filepath: str) -> Any:
+    """
+    读取并解析 JSON 文件，文件未变化时直接返回上次解析结果
+    返回值为共享缓存，调用方不可原地修改；文件不存在或为空时返回 None
+    """
+    path = os.path.abspath(filepath)
+    try:
+        st = await aiofiles.os.stat(path)
+    except FileNotFoundError:
+        _json_cache.pop(path, None)
+        return None
+
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _json_cache.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    content = await FileOperator(path).read()
+    data = orjson.loads(content) if content else None
+    _json_cache[path] = (stamp, data)
+    return data
+
+
+async def write_json_cached(filepath: str, data: Any) -> None:
+    """
+    原子写入 JSON 文件，并以写入的数据直接更新解析缓存
+    写入后调用方不可再修改 data
+    """
+    path = os.path.abspath(filepath)
+    await FileOperator(path).write(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+    st = await aiofiles.os.stat(path)
+    _json_cache[path] = ((st.st_mtime_ns, st.st_size, st.st_ino), data)
+
+
+def invalidate_json_cache(filepath: str):
+    """写入文件后使对应的解析缓存失效"""
+    _json_cache.pop(os.path.abspath(filepath), None)
@@ -0,0 +1,92 @@
+"""
+JSON 列表配置文件存储
+
+ai.config、notifier.config 等文件均为以字符串 id 为主键的对象列表，
+统一提供带缓存的读取、按 id 索引以及增删改写入。
+"""
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+from src.utils.file_operator import read_json_cached, write_json_cached
+
+
+class JsonListStore:
+    """以 id 为主键的 JSON 列表文件"""
+
+    def __init__(self, filepath: str, first_id: int = 0):
+        """
+        Args:
+            filepath: 配置文件路径
+            first_id: 列表为空时分配的第一个 id
+        """
+        self.filepath = filepath
+        self.first_id = first_id
+        # (已解析的列表, id -> 配置)，解析缓存更新后重建
+        self._index: Tuple[Optional[List[Dict[str, Any]]], Dict[str, Dict[str, Any]]] = (None, {})
+        # (已解析的列表, 当前最大数字 id)
+        self._max_id: Tuple[Optional[List[Dict[str, Any]]], int] = (None, first_id - 1)
+
+    async def get_all(self) -> List[Dict[str, Any]]:
+        """获取全部配置（共享缓存，不可原地修改）"""
+        try:
+            data = await read_json_cached(self.filepath)
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"{os.path.basename(self.filepath)}文件JSON格式错误: {e}")
+        return data if isinstance(data, list) else []
+
+    async def get(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """按 id 获取配置（共享缓存，不可原地修改）"""
+        data = await self.get_all()
+        if self._index[0] is not data:
+            # 逆序构建，id 重复时保留第一条
+            self._index = (data, {
+                item.get('id'): item for item in reversed(data) if isinstance(item, dict)
+            })
+        return self._index[1].get(item_id)
+
+    async def add(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """分配新 id 并追加配置"""
+        current = await self.get_all()
+        if self._max_id[0] is not current:
+            self._max_id = (current, max(
+                (int(it['id']) for it in current if str(it.get('id', '')).isdigit()),
+                default=self.first_id - 1
+            ))
+
+        new_id = self._max_id[1] + 1
+        item['id'] = str(new_id)
+        data = [*current, item]
+        await write_json_cached(self.filepath, data)
+        # 写入后缓存的即为 data，连续新增无需重新扫描
+        self._max_id = (data, new_id)
+        return item
+
+    async def update(self, item_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """合并更新指定配置，不存在时返回 None"""
+        data = list(await self.get_all())
+        index = self._position(data, item_id)
+        if index == -1:
+            return None
+
+        # 缓存中的数据共享给读取方，替换为新字典而不原地修改
+        item = {**data[index], **changes}
+        data[index] = item
+        await write_json_cached(self.filepath, data)
+        return item
+
+    async def remove(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """删除指定配置，不存在时返回 None"""
+        data = list(await self.get_all())
+        index = self._position(data, item_id)
+        if index == -1:
+            return None
+
+        removed = data.pop(index)
+        await write_json_cached(self.filepath, data)
+        return removed
+
+    @staticmethod
+    def _position(data: List[Dict[str, Any]], item_id: str) -> int:
+        return next((i for i, item in enumerate(data) if item.get('id') == item_id), -1)